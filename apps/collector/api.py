@@ -0,0 +1,194 @@
+# api.py
+from sources.mongodb import MongoDBHandler, DEFAULT_MONGODB_CONFIG
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+import threading
+import re
+import logging
+import json
+import time
+import os
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Horário seguido de um offset cujo '+' virou espaço na query string
+OFFSET_AS_SPACE = re.compile(r'(\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?) (\d{2}:?\d{2})$')
+
+
+class TTLCache:
+    """In-memory cache whose entries expire after ttl seconds or on new writes"""
+    def __init__(self, ttl: float = 30, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+        self._marker: Any = None
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key, marker: Any, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling loader on a miss
+
+        Args:
+            key: Hashable cache key
+            marker: Latest write marker; a change drops every cached entry
+            loader: Function that produces the value on a miss
+        """
+        now = time.monotonic()
+        with self._lock:
+            if marker != self._marker:
+                self._entries.clear()
+                self._marker = marker
+
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+
+        value = loader()
+
+        with self._lock:
+            if marker == self._marker:
+                if len(self._entries) >= self.max_entries:
+                    self._entries.clear()
+                self._entries[key] = (now + self.ttl, value)
+        return value
+
+
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 query parameter
+
+    parse_qs decodes '+' as a space, so an unescaped offset such as
+    '2026-10-19T00:00:00+03:00' arrives as '2026-10-19T00:00:00 03:00'
+    and is restored here. Values without an offset are returned naive;
+    MongoDBHandler._to_utc_iso treats them as UTC when building the query.
+    """
+    if not value:
+        return None
+    value = OFFSET_AS_SPACE.sub(r'\1+\2', value.strip())
+    return datetime.fromisoformat(value)
+
+
+class SummariesAPI:
+    """Read-only access to the summaries collection, backed by TTLCache"""
+    def __init__(self, mongo_handler: MongoDBHandler, cache: TTLCache, marker_ttl: float = 1):
+        self.mongo_handler = mongo_handler
+        self.cache = cache
+        self.marker_ttl = marker_ttl
+        self._marker = None
+        self._marker_expires_at = 0.0
+        self._marker_lock = threading.Lock()
+
+    def _write_marker(self):
+        """
+        Return the collection write marker, re-reading it at most every marker_ttl seconds
+
+        Keeps cache hits from costing a MongoDB round trip each, at the price of
+        serving data up to marker_ttl seconds older than the latest write.
+        """
+        now = time.monotonic()
+        with self._marker_lock:
+            if now >= self._marker_expires_at:
+                self._marker = self.mongo_handler.last_write_marker()
+                self._marker_expires_at = now + self.marker_ttl
+            return self._marker
+
+    def _cached(self, key, loader: Callable[[], Any]) -> Any:
+        return self.cache.get_or_load(key, self._write_marker(), loader)
+
+    def list_summaries(self, params: Dict[str, str]) -> Dict:
+        source = params.get('source')
+        start = parse_datetime(params.get('start'))
+        end = parse_datetime(params.get('end'))
+        page, page_size = MongoDBHandler.clamp_pagination(
+            params.get('page', 1), params.get('page_size', 20)
+        )
+
+        key = ('list', source, start, end, page, page_size)
+        items = self._cached(key, lambda: self.mongo_handler.find_summaries(
+            source=source, start=start, end=end, page=page, page_size=page_size
+        ))
+        return {
+            'page': page,
+            'page_size': page_size,
+            'items': items
+        }
+
+    def latest_summary(self, params: Dict[str, str]) -> Optional[Dict]:
+        source = params.get('source')
+        return self._cached(('latest', source), lambda: self.mongo_handler.find_latest_summary(source=source))
+
+
+def make_handler(api: SummariesAPI):
+    class SummariesRequestHandler(BaseHTTPRequestHandler):
+        routes = {
+            '/summaries': api.list_summaries,
+            '/summaries/latest': api.latest_summary,
+        }
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            route = self.routes.get(url.path.rstrip('/') or '/')
+            if not route:
+                self._send_json(404, {'error': 'Not found'})
+                return
+
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+            try:
+                result = route(params)
+            except ValueError as e:
+                self._send_json(400, {'error': str(e)})
+                return
+            except Exception as e:
+                logger.error(f"Error handling {url.path}: {str(e)}")
+                self._send_json(500, {'error': 'Internal server error'})
+                return
+
+            if result is None:
+                self._send_json(404, {'error': 'No summary found'})
+            else:
+                self._send_json(200, result)
+
+        def _send_json(self, status: int, body: Any) -> None:
+            payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            logger.info(format % args)
+
+    return SummariesRequestHandler
+
+
+def run_api():
+    host = os.environ.get('API_HOST', '0.0.0.0')
+    port = int(os.environ.get('API_PORT', 8000))
+    ttl = float(os.environ.get('API_CACHE_TTL', 30))
+    marker_ttl = float(os.environ.get('API_MARKER_TTL', 1))
+
+    mongodb_config = dict(DEFAULT_MONGODB_CONFIG)
+    if os.environ.get('MONGODB_URI'):
+        mongodb_config['MONGODB_URI'] = os.environ['MONGODB_URI']
+
+    api = SummariesAPI(MongoDBHandler(mongodb_config), TTLCache(ttl=ttl), marker_ttl=marker_ttl)
+    server = ThreadingHTTPServer((host, port), make_handler(api))
+    logger.info(f"Summaries API listening on {host}:{port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    run_api()
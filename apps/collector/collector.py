@@ -1,5 +1,7 @@
 from sources.news import NewsRSSSource
 from sources.crypto import CryptoPrice
+from sources.mongodb import MongoDBHandler, DEFAULT_MONGODB_CONFIG
+from coordination import FeedLeaseManager
 from typing import Dict, Any
 import logging
 import json
@@ -10,17 +12,50 @@ logger = logging.getLogger(__name__)
 
 class DataCollector:
     def __init__(self, config):
+        self.config = config
+        self.lease_manager = None
+        self.mongo_handler = None
+
+        # Modo coordenado: vários workers dividem os feeds via leases no MongoDB
+        coordination = config.get('coordination', {})
+        if coordination.get('enabled'):
+            # Uma única conexão compartilhada pelos leases e por todas as fontes
+            self.mongo_handler = MongoDBHandler(DEFAULT_MONGODB_CONFIG)
+            self.lease_manager = FeedLeaseManager(
+                self.mongo_handler,
+                worker_id=coordination.get('worker_id') or os.environ.get('WORKER_ID'),
+                lease_seconds=coordination.get('lease_seconds', 300),
+                collect_interval=coordination.get('collect_interval', 3600)
+            )
+            self.sources = {
+                feed['url']: NewsRSSSource({**config, 'sources': [feed]}, mongo_handler=self.mongo_handler)
+                for feed in config.get('sources', []) if feed.get('type') == 'rss'
+            }
+            return
+
         self.sources = {
             # 'crypto': CryptoPrice(config),
             'news': NewsRSSSource(config)
         }
 
+    def close(self) -> None:
+        """Close the OpenAI and MongoDB clients opened by the sources"""
+        for source in self.sources.values():
+            source.close()
+        if self.mongo_handler:
+            self.mongo_handler.close()
+
     def collect(self) -> Dict[str, Any]:
         collected_data = {
             'timestamp': datetime.utcnow().isoformat(),
             'data': {}
         }
 
+        if self.lease_manager:
+            self._collect_leased_feeds(collected_data)
+            self._save_to_file(collected_data)
+            return collected_data
+
         for source_name, source in self.sources.items():
             try:
                 logger.info(f"Collecting data from {source_name}")
@@ -35,6 +70,59 @@ class DataCollector:
         self._save_to_file(collected_data)
         return collected_data
 
+    def _collect_leased_feeds(self, collected_data: Dict[str, Any]) -> None:
+        """Collect only the RSS feeds this worker manages to lease"""
+        for feed_id, source in self.sources.items():
+            try:
+                claimed = self.lease_manager.claim(feed_id)
+            except Exception as e:
+                logger.error(f"Error claiming lease for {feed_id}: {str(e)}")
+                continue
+
+            if not claimed:
+                logger.info(f"Feed {feed_id} is leased or already collected in this window, skipping")
+                continue
+
+            try:
+                logger.info(f"Collecting leased feed {feed_id} as {self.lease_manager.worker_id}")
+
+                with self.lease_manager.renewing(feed_id) as lease_lost:
+                    data = source.collect(abort=lease_lost)
+            except Exception as e:
+                logger.error(f"Error collecting from {feed_id}: {str(e)}")
+                collected_data['data'][feed_id] = []
+                self._release_lease(feed_id)
+                continue
+
+            collected_data['data'][feed_id] = data
+
+            if lease_lost.is_set():
+                # Sem complete(): o lease já não é deste worker
+                logger.warning(f"Lease for {feed_id} was lost during collection")
+                continue
+
+            # DataSource.collect não propaga falhas de fetch/LLM: devolve [] ou
+            # um resumo com 'error'. Libera para outro worker tentar nesta janela
+            if not data or 'error' in data:
+                logger.warning(f"Collection of {feed_id} failed, releasing lease for retry")
+                self._release_lease(feed_id)
+                continue
+
+            logger.info(f"Data collected from {feed_id}")
+
+            # Falha aqui não libera o lease: os dados já foram salvos, então é
+            # melhor deixá-lo expirar do que outro worker refazer o feed agora
+            try:
+                self.lease_manager.complete(feed_id)
+            except Exception as e:
+                logger.error(f"Error completing lease for {feed_id}: {str(e)}")
+
+    def _release_lease(self, feed_id: str) -> None:
+        try:
+            self.lease_manager.release(feed_id)
+        except Exception as e:
+            logger.error(f"Error releasing lease for {feed_id}: {str(e)}")
+
     def _save_to_file(self, data: Dict[str, Any]) -> None:
         os.makedirs("output", exist_ok=True)
         filename = f"output/data_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
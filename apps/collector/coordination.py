@@ -0,0 +1,158 @@
+# coordination.py
+from sources.mongodb import MongoDBHandler
+from pymongo.errors import DuplicateKeyError
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional
+import threading
+import logging
+import socket
+import time
+import os
+
+# Milissegundos desde a epoch no relógio do servidor ($$NOW), para que a
+# diferença de relógio entre workers não afete leases nem janelas
+EPOCH = datetime(1970, 1, 1)
+SERVER_NOW_MS = {'$subtract': ['$$NOW', EPOCH]}
+
+
+class FeedLeaseManager:
+    """
+    Time-limited feed leases stored in MongoDB
+
+    Each feed has one lease document keyed by its id. A worker may only claim
+    a feed whose lease has expired and that was not completed in the current
+    collection window, and the claim is a single atomic find_one_and_update,
+    so two workers can never hold the same feed.
+
+    Windows are consecutive collect_interval-second slots counted from the
+    epoch: a feed completed in one window becomes claimable again as soon as
+    the next one starts, regardless of how long its collection took.
+
+    Expiry (expires_at_ms) and windows are computed by the server from $$NOW
+    inside pipeline updates, so workers never compare their own clocks.
+    """
+    def __init__(self,
+                 mongo_handler: MongoDBHandler,
+                 worker_id: Optional[str] = None,
+                 lease_seconds: int = 300,
+                 collect_interval: int = 3600,
+                 collection_name: str = 'feed_leases'):
+        self.mongo_handler = mongo_handler
+        self.collection_name = collection_name
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.collect_interval = collect_interval
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def collection(self):
+        # Resolvido a cada uso: MongoDBHandler.reconnect() troca o client
+        return self.mongo_handler.db[self.collection_name]
+
+    def _expires_at_ms(self, seconds: Optional[float] = None) -> dict:
+        """Server-side expression for now + seconds (defaults to lease_seconds)"""
+        seconds = self.lease_seconds if seconds is None else seconds
+        return {'$add': [SERVER_NOW_MS, int(seconds * 1000)]}
+
+    def _current_window(self) -> dict:
+        """Server-side expression for the window the server's now falls in"""
+        return {'$floor': {'$divide': [SERVER_NOW_MS, self.collect_interval * 1000]}}
+
+    def claim(self, feed_id: str) -> bool:
+        """
+        Try to take the lease for a feed
+
+        Returns:
+            bool: True if this worker now holds the lease
+        """
+        try:
+            # Sem lease, ou lease expirado e não concluído nesta janela: o
+            # upsert cria/assume o documento. Caso contrário o filtro não casa
+            # e o upsert colide com o _id existente (DuplicateKeyError).
+            self.collection.find_one_and_update(
+                {'_id': feed_id, '$expr': {'$and': [
+                    {'$lte': ['$expires_at_ms', SERVER_NOW_MS]},
+                    {'$ne': [{'$ifNull': ['$completed_window', None]}, self._current_window()]}
+                ]}},
+                [{'$set': {
+                    'owner': self.worker_id,
+                    'window': self._current_window(),
+                    'claimed_at': '$$NOW',
+                    'expires_at_ms': self._expires_at_ms()
+                }}],
+                upsert=True
+            )
+        except DuplicateKeyError:
+            return False
+
+        return True
+
+    def renew(self, feed_id: str) -> bool:
+        """Extend a lease held by this worker. Returns False if it was lost"""
+        lease = self.collection.find_one_and_update(
+            {'_id': feed_id, 'owner': self.worker_id},
+            [{'$set': {'expires_at_ms': self._expires_at_ms()}}]
+        )
+        return lease is not None
+
+    def complete(self, feed_id: str) -> bool:
+        """
+        Mark a feed as done for the window it was claimed in
+
+        The lease is released, but the feed cannot be claimed again until the
+        next window starts. Returns False if the lease was not held.
+        """
+        result = self.collection.update_one(
+            {'_id': feed_id, 'owner': self.worker_id},
+            [{'$set': {
+                'completed_at': '$$NOW',
+                'completed_window': '$window',
+                'expires_at_ms': SERVER_NOW_MS
+            }}]
+        )
+        return result.modified_count == 1
+
+    def release(self, feed_id: str) -> None:
+        """Give the lease up immediately so another worker can take the feed"""
+        self.collection.update_one(
+            {'_id': feed_id, 'owner': self.worker_id},
+            [{'$set': {'expires_at_ms': SERVER_NOW_MS}}]
+        )
+
+    @contextmanager
+    def renewing(self, feed_id: str):
+        """
+        Keep renewing a claimed lease in the background while the block runs
+
+        Yields a threading.Event that is set once the lease is lost, either
+        because another worker took it or because renewals kept failing until
+        it expired. Callers should stop spending work on the feed when it is set.
+        """
+        stop = threading.Event()
+        lost = threading.Event()
+        interval = max(self.lease_seconds / 3, 1)
+
+        def renew_loop():
+            last_renewed = time.monotonic()
+            while not stop.wait(interval):
+                try:
+                    if not self.renew(feed_id):
+                        self.logger.warning(f"Lost lease for {feed_id}")
+                        lost.set()
+                        return
+                    last_renewed = time.monotonic()
+                except Exception as e:
+                    self.logger.error(f"Error renewing lease for {feed_id}: {str(e)}")
+                    if time.monotonic() - last_renewed >= self.lease_seconds:
+                        self.logger.warning(f"Lease for {feed_id} expired without renewal")
+                        lost.set()
+                        return
+
+        renewer = threading.Thread(target=renew_loop, name=f"lease-{feed_id}", daemon=True)
+        renewer.start()
+        try:
+            yield lost
+        finally:
+            stop.set()
+            renewer.join()
@@ -17,7 +17,10 @@ def run_collector():
             config = json.load(f)
         
         collector = DataCollector(config)
-        data = collector.collect()
+        try:
+            data = collector.collect()
+        finally:
+            collector.close()
        
         output_file = f'output/output_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
         with open(output_file, 'w', encoding='utf-8') as f:
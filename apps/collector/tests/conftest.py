@@ -0,0 +1,69 @@
+# tests/conftest.py
+from sources.mongodb import MongoDBHandler
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+from datetime import datetime, timezone
+import uuid
+import os
+import pytest
+
+MONGODB_TEST_URI = os.environ.get('MONGODB_TEST_URI', 'mongodb://localhost:27017')
+
+
+@pytest.fixture
+def mongomock_handler(monkeypatch):
+    """MongoDBHandler backed by mongomock instead of a real server"""
+    mongomock = pytest.importorskip('mongomock')
+    monkeypatch.setattr('sources.mongodb.MongoClient', mongomock.MongoClient)
+
+    # mongomock não implementa a variável $$NOW usada pelos leases; ela é
+    # injetada como variável do parser, com o mesmo formato (UTC sem tzinfo)
+    # que o servidor devolve
+    parser_init = mongomock.aggregate._Parser.__init__
+
+    def init_with_now(self, *args, **kwargs):
+        parser_init(self, *args, **kwargs)
+        self._user_vars.setdefault('NOW', datetime.now(timezone.utc).replace(tzinfo=None))
+
+    monkeypatch.setattr(mongomock.aggregate._Parser, '__init__', init_with_now)
+
+    return MongoDBHandler({
+        'MONGODB_URI': 'mongodb://localhost:27017',
+        'MONGODB_DATABASE': 'kaleid_test',
+        'MONGODB_COLLECTION': 'summaries'
+    })
+
+
+@pytest.fixture(scope='session')
+def mongod_client():
+    """Client for a local mongod, pinged once per session (skipped if none)"""
+    client = MongoClient(MONGODB_TEST_URI, serverSelectionTimeoutMS=1000)
+    try:
+        client.admin.command('ping')
+    except PyMongoError:
+        client.close()
+        pytest.skip(f"No mongod available at {MONGODB_TEST_URI}")
+
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def mongod_handler(mongod_client):
+    """MongoDBHandler on a throwaway database of a local mongod (skipped if none)"""
+    db_name = f"kaleid_test_{uuid.uuid4().hex[:8]}"
+    handler = MongoDBHandler({
+        'MONGODB_URI': MONGODB_TEST_URI,
+        'MONGODB_DATABASE': db_name,
+        'MONGODB_COLLECTION': 'summaries'
+    })
+    yield handler
+
+    mongod_client.drop_database(db_name)
+    handler.close()
+
+
+@pytest.fixture(params=['mongomock', 'mongod'])
+def db_handler(request):
+    """Run a test against mongomock and, when available, a local mongod"""
+    return request.getfixturevalue(f"{request.param}_handler")
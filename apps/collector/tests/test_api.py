@@ -0,0 +1,167 @@
+# tests/test_api.py
+from api import TTLCache, SummariesAPI, make_handler, parse_datetime
+from http.server import ThreadingHTTPServer
+from urllib.error import HTTPError
+from urllib.request import urlopen
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+import threading
+import json
+import pytest
+
+
+class Loader:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.calls
+
+
+def test_cache_hit_returns_cached_value():
+    cache = TTLCache(ttl=30)
+    loader = Loader()
+
+    assert cache.get_or_load('k', 1, loader) == 1
+    assert cache.get_or_load('k', 1, loader) == 1
+    assert loader.calls == 1
+
+
+def test_cache_entry_expires_after_ttl():
+    cache = TTLCache(ttl=30)
+    loader = Loader()
+
+    with mock.patch('api.time.monotonic', return_value=100.0):
+        cache.get_or_load('k', 1, loader)
+    with mock.patch('api.time.monotonic', return_value=131.0):
+        assert cache.get_or_load('k', 1, loader) == 2
+
+
+def test_cache_marker_change_clears_entries():
+    cache = TTLCache(ttl=30)
+    loader = Loader()
+
+    cache.get_or_load('a', 1, loader)
+    cache.get_or_load('b', 1, loader)
+    assert cache.get_or_load('a', 2, loader) == 3
+    assert cache.get_or_load('b', 2, loader) == 4
+
+
+def test_parse_datetime():
+    assert parse_datetime(None) is None
+    assert parse_datetime('2026-10-19T00:00:00') == datetime(2026, 10, 19)
+    assert parse_datetime('2026-10-19 10:00') == datetime(2026, 10, 19, 10, 0)
+    assert parse_datetime('2026-10-19T00:00:00+03:00') == datetime(
+        2026, 10, 19, tzinfo=timezone(timedelta(hours=3))
+    )
+
+
+def test_parse_datetime_restores_plus_decoded_as_space():
+    # '+' não escapado chega como espaço depois do parse_qs
+    assert parse_datetime('2026-10-19T00:00:00 03:00') == datetime(
+        2026, 10, 19, tzinfo=timezone(timedelta(hours=3))
+    )
+    assert parse_datetime('2026-10-19T00:00:00.5 0300') == datetime(
+        2026, 10, 19, 0, 0, 0, 500000, tzinfo=timezone(timedelta(hours=3))
+    )
+
+
+def test_list_summaries_clamps_before_caching():
+    handler = mock.Mock()
+    handler.last_write_marker.return_value = 0
+    handler.find_summaries.return_value = []
+    api = SummariesAPI(handler, TTLCache())
+
+    first = api.list_summaries({'page': '0', 'page_size': '1000'})
+    api.list_summaries({'page': '1', 'page_size': '100'})
+
+    assert first == {'page': 1, 'page_size': 100, 'items': []}
+    handler.find_summaries.assert_called_once_with(
+        source=None, start=None, end=None, page=1, page_size=100
+    )
+
+
+def test_write_marker_is_reread_at_most_every_marker_ttl():
+    handler = mock.Mock()
+    handler.last_write_marker.return_value = 0
+    handler.find_latest_summary.return_value = {'master_summary': 'x'}
+    api = SummariesAPI(handler, TTLCache(), marker_ttl=1)
+
+    with mock.patch('api.time.monotonic', return_value=100.0):
+        api.latest_summary({})
+        api.latest_summary({})
+    assert handler.last_write_marker.call_count == 1
+
+    with mock.patch('api.time.monotonic', return_value=101.5):
+        api.latest_summary({})
+    assert handler.last_write_marker.call_count == 2
+
+
+def test_latest_summary_served_against_mongomock(mongomock_handler):
+    api = SummariesAPI(mongomock_handler, TTLCache(), marker_ttl=0)
+    assert api.latest_summary({}) is None
+
+    mongomock_handler.save_to_mongodb({'master_summary': 'fresh', 'sources': []})
+
+    assert api.latest_summary({})['master_summary'] == 'fresh'
+
+
+@pytest.fixture
+def api_server(mongomock_handler):
+    """Summaries API served on a free local port, backed by mongomock"""
+    api = SummariesAPI(mongomock_handler, TTLCache(), marker_ttl=0)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(api))
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def get(url):
+    try:
+        with urlopen(url) as response:
+            return response.status, json.loads(response.read())
+    except HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_http_latest_summary_not_found(api_server):
+    assert get(f"{api_server}/summaries/latest") == (404, {'error': 'No summary found'})
+
+
+def test_http_unknown_path(api_server):
+    assert get(f"{api_server}/nope") == (404, {'error': 'Not found'})
+
+
+def test_http_lists_and_returns_latest(api_server, mongomock_handler):
+    mongomock_handler.save_to_mongodb({
+        'master_summary': 'resumo',
+        'sources': ['https://a.example/rss'],
+        'created_at': datetime(2026, 10, 19, 12, tzinfo=timezone.utc)
+    })
+
+    status, body = get(f"{api_server}/summaries?source=https://a.example/rss&start=2026-10-19T14:00:00+03:00")
+    assert status == 200
+    assert body['page'] == 1 and body['page_size'] == 20
+    assert [item['master_summary'] for item in body['items']] == ['resumo']
+    assert '_id' not in body['items'][0]
+
+    status, body = get(f"{api_server}/summaries/latest/?source=https://a.example/rss")
+    assert status == 200
+    assert body['master_summary'] == 'resumo'
+
+
+@pytest.mark.parametrize('query', [
+    'page=abc',
+    'page=99999999999999999999',
+    'start=not-a-date',
+])
+def test_http_bad_parameters(api_server, query):
+    status, body = get(f"{api_server}/summaries?{query}")
+    assert status == 400
+    assert 'error' in body
@@ -0,0 +1,116 @@
+# tests/test_collector.py
+from collector import DataCollector
+from contextlib import contextmanager
+from unittest import mock
+import threading
+import pytest
+
+FEED = 'https://a.example/rss'
+SUMMARY = {'master_summary': 'resumo', 'sources': [FEED]}
+
+
+class FakeLeaseManager:
+    """FeedLeaseManager stand-in that records calls and can lose the lease on demand"""
+    def __init__(self, claimed=True, lose_lease=False):
+        self.worker_id = 'worker-a'
+        self.claim = mock.Mock(return_value=claimed)
+        self.complete = mock.Mock(return_value=True)
+        self.release = mock.Mock()
+        self.lose_lease = lose_lease
+
+    @contextmanager
+    def renewing(self, feed_id):
+        lost = threading.Event()
+        if self.lose_lease:
+            lost.set()
+        yield lost
+
+
+def make_collector(lease_manager, collect):
+    collector = DataCollector.__new__(DataCollector)
+    collector.config = {}
+    collector.lease_manager = lease_manager
+    collector.sources = {FEED: mock.Mock(collect=collect)}
+    return collector
+
+
+def run(collector):
+    collected_data = {'data': {}}
+    collector._collect_leased_feeds(collected_data)
+    return collected_data['data']
+
+
+def test_success_completes_lease():
+    leases = FakeLeaseManager()
+    collector = make_collector(leases, mock.Mock(return_value=SUMMARY))
+
+    assert run(collector) == {FEED: SUMMARY}
+    leases.complete.assert_called_once_with(FEED)
+    leases.release.assert_not_called()
+
+
+def test_unclaimed_feed_is_skipped():
+    leases = FakeLeaseManager(claimed=False)
+    collect = mock.Mock()
+    collector = make_collector(leases, collect)
+
+    assert run(collector) == {}
+    collect.assert_not_called()
+    leases.complete.assert_not_called()
+
+
+def test_claim_error_moves_on():
+    leases = FakeLeaseManager()
+    leases.claim.side_effect = Exception('primary stepped down')
+    collect = mock.Mock()
+    collector = make_collector(leases, collect)
+
+    assert run(collector) == {}
+    collect.assert_not_called()
+
+
+def test_exception_releases_lease():
+    leases = FakeLeaseManager()
+    collector = make_collector(leases, mock.Mock(side_effect=Exception('boom')))
+
+    assert run(collector) == {FEED: []}
+    leases.release.assert_called_once_with(FEED)
+    leases.complete.assert_not_called()
+
+
+def test_release_error_is_contained():
+    leases = FakeLeaseManager()
+    leases.release.side_effect = Exception('primary stepped down')
+    collector = make_collector(leases, mock.Mock(side_effect=Exception('boom')))
+
+    assert run(collector) == {FEED: []}
+
+
+@pytest.mark.parametrize('result', [[], {'error': 'openai down', 'generated_at': 'x'}])
+def test_failed_result_releases_lease(result):
+    leases = FakeLeaseManager()
+    collector = make_collector(leases, mock.Mock(return_value=result))
+
+    run(collector)
+    leases.release.assert_called_once_with(FEED)
+    leases.complete.assert_not_called()
+
+
+def test_lost_lease_is_neither_completed_nor_released():
+    leases = FakeLeaseManager(lose_lease=True)
+    collect = mock.Mock(return_value=[])
+    collector = make_collector(leases, collect)
+
+    assert run(collector) == {FEED: []}
+    assert collect.call_args.kwargs['abort'].is_set()
+    leases.complete.assert_not_called()
+    leases.release.assert_not_called()
+
+
+def test_complete_error_does_not_release():
+    leases = FakeLeaseManager()
+    leases.complete.side_effect = Exception('primary stepped down')
+    collector = make_collector(leases, mock.Mock(return_value=SUMMARY))
+
+    assert run(collector) == {FEED: SUMMARY}
+    leases.release.assert_not_called()
@@ -0,0 +1,150 @@
+# tests/test_coordination.py
+from coordination import FeedLeaseManager
+from sources.mongodb import MongoDBHandler
+from datetime import datetime, timezone
+import multiprocessing
+import threading
+import pytest
+import os
+
+FEED = 'https://a.example/rss'
+MONGODB_TEST_URI = os.environ.get('MONGODB_TEST_URI', 'mongodb://localhost:27017')
+
+
+@pytest.fixture
+def make_manager(db_handler):
+    def factory(worker_id, **kwargs):
+        return FeedLeaseManager(db_handler, worker_id=worker_id, **kwargs)
+    return factory
+
+
+def expire(manager, feed_id=FEED):
+    manager.collection.update_one(
+        {'_id': feed_id},
+        {'$set': {'expires_at_ms': 0}}
+    )
+
+
+def test_claim_free_feed(make_manager):
+    a = make_manager('a')
+
+    assert a.claim(FEED)
+    assert a.collection.find_one({'_id': FEED})['owner'] == 'a'
+
+
+def test_claim_held_feed_fails(make_manager):
+    a, b = make_manager('a'), make_manager('b')
+    a.claim(FEED)
+
+    assert not b.claim(FEED)
+    assert a.collection.find_one({'_id': FEED})['owner'] == 'a'
+
+
+def test_claim_expired_feed(make_manager):
+    a, b = make_manager('a'), make_manager('b')
+    a.claim(FEED)
+    expire(a)
+
+    assert b.claim(FEED)
+    assert not a.renew(FEED)
+
+
+def test_renew_complete_release_limited_to_owner(make_manager):
+    a, b = make_manager('a'), make_manager('b')
+    a.claim(FEED)
+    expires_at_ms = a.collection.find_one({'_id': FEED})['expires_at_ms']
+
+    assert not b.renew(FEED)
+    assert not b.complete(FEED)
+    b.release(FEED)
+
+    lease = a.collection.find_one({'_id': FEED})
+    assert lease['owner'] == 'a'
+    assert lease['expires_at_ms'] == expires_at_ms
+    assert 'completed_window' not in lease
+    assert a.renew(FEED)
+
+
+def test_release_lets_another_worker_claim(make_manager):
+    a, b = make_manager('a'), make_manager('b')
+    a.claim(FEED)
+    a.release(FEED)
+
+    assert b.claim(FEED)
+
+
+def test_claim_sets_server_side_expiry_and_window(make_manager):
+    a = make_manager('a', lease_seconds=60, collect_interval=3600)
+    now_ms = datetime.now(timezone.utc).timestamp() * 1000
+
+    a.claim(FEED)
+    lease = a.collection.find_one({'_id': FEED})
+
+    assert abs(lease['expires_at_ms'] - (now_ms + 60_000)) < 5_000
+    assert lease['window'] == now_ms // 3_600_000
+
+
+def test_completed_feed_waits_for_next_window(make_manager):
+    a, b = make_manager('a'), make_manager('b')
+
+    assert a.claim(FEED)
+    assert a.complete(FEED)
+    lease = a.collection.find_one({'_id': FEED})
+    assert lease['completed_window'] == lease['window']
+    assert not b.claim(FEED)
+
+    # Simula a virada da janela: a conclusão passa a ser da janela anterior
+    a.collection.update_one({'_id': FEED}, {'$inc': {'completed_window': -1}})
+    assert b.claim(FEED)
+
+
+def test_two_managers_compete_for_one_feed(make_manager):
+    managers = [make_manager('a'), make_manager('b')]
+    barrier = threading.Barrier(len(managers))
+    results = {}
+
+    def race(manager):
+        barrier.wait()
+        results[manager.worker_id] = manager.claim(FEED)
+
+    threads = [threading.Thread(target=race, args=(m,)) for m in managers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(results.values()) == [False, True]
+
+
+def test_renewing_signals_lost_lease(make_manager):
+    a, b = make_manager('a', lease_seconds=1), make_manager('b')
+    a.claim(FEED)
+
+    with a.renewing(FEED) as lost:
+        expire(a)
+        b.claim(FEED)
+        assert lost.wait(timeout=5)
+
+
+def claim_feeds(db_name, worker_id, feeds):
+    handler = MongoDBHandler({
+        'MONGODB_URI': MONGODB_TEST_URI,
+        'MONGODB_DATABASE': db_name,
+        'MONGODB_COLLECTION': 'summaries'
+    })
+    try:
+        manager = FeedLeaseManager(handler, worker_id=worker_id)
+        return [feed for feed in feeds if manager.claim(feed)]
+    finally:
+        handler.close()
+
+
+def test_processes_split_feeds_without_duplicates(mongod_handler):
+    feeds = [f"https://feed{i}.example/rss" for i in range(20)]
+    workers = [f"worker-{i}" for i in range(3)]
+
+    with multiprocessing.get_context('spawn').Pool(len(workers)) as pool:
+        claimed = pool.starmap(claim_feeds, [(mongod_handler.db_name, w, feeds) for w in workers])
+
+    all_claimed = [feed for worker_feeds in claimed for feed in worker_feeds]
+    assert sorted(all_claimed) == sorted(feeds)
@@ -0,0 +1,104 @@
+# tests/test_mongodb.py
+from sources.mongodb import MongoDBHandler, MAX_PAGE, MAX_PAGE_SIZE
+from datetime import datetime, timedelta, timezone
+import pytest
+
+
+def insert_summaries(handler, count, sources=('https://a.example/rss',)):
+    base = datetime(2026, 10, 19, tzinfo=timezone.utc)
+    for i in range(count):
+        handler.save_to_mongodb({
+            'master_summary': f"summary {i}",
+            'sources': list(sources),
+            'source_count': len(sources),
+            'total_items': i,
+            'created_at': base + timedelta(hours=i)
+        })
+    return base
+
+
+def test_build_summary_filter_empty():
+    assert MongoDBHandler._build_summary_filter() == {}
+
+
+def test_build_summary_filter_source_and_range_as_utc_strings():
+    start = datetime(2026, 10, 19, 3, 0, tzinfo=timezone(timedelta(hours=3)))
+    end = datetime(2026, 10, 20)
+
+    query = MongoDBHandler._build_summary_filter('https://a.example/rss', start, end)
+
+    assert query == {
+        'sources': 'https://a.example/rss',
+        'created_at': {
+            '$gte': '2026-10-19T00:00:00+00:00',
+            '$lt': '2026-10-20T00:00:00+00:00'
+        }
+    }
+
+
+def test_clamp_pagination():
+    assert MongoDBHandler.clamp_pagination(0, 0) == (1, 1)
+    assert MongoDBHandler.clamp_pagination('2', '10') == (2, 10)
+    assert MongoDBHandler.clamp_pagination(1, 10_000) == (1, MAX_PAGE_SIZE)
+    assert MongoDBHandler.clamp_pagination(MAX_PAGE, 1) == (MAX_PAGE, 1)
+
+
+def test_clamp_pagination_rejects_deep_pages():
+    with pytest.raises(ValueError):
+        MongoDBHandler.clamp_pagination(MAX_PAGE + 1, 20)
+    with pytest.raises(ValueError):
+        MongoDBHandler.clamp_pagination('99999999999999999999', 20)
+    with pytest.raises(ValueError):
+        MongoDBHandler.clamp_pagination('abc', 20)
+
+
+def test_ensure_indexes(db_handler):
+    index_names = set(db_handler.collection.index_information())
+    assert {'created_at_desc', 'sources_created_at_desc'} <= index_names
+
+
+def test_find_summaries_paginates_newest_first(db_handler):
+    insert_summaries(db_handler, 5)
+
+    first = db_handler.find_summaries(page=1, page_size=2)
+    third = db_handler.find_summaries(page=3, page_size=2)
+
+    assert [s['master_summary'] for s in first] == ['summary 4', 'summary 3']
+    assert [s['master_summary'] for s in third] == ['summary 0']
+
+
+def test_find_summaries_default_projection(db_handler):
+    insert_summaries(db_handler, 1)
+
+    summary = db_handler.find_summaries()[0]
+
+    assert '_id' not in summary
+    assert 'updated_at' not in summary
+    assert summary['master_summary'] == 'summary 0'
+
+
+def test_find_summaries_created_at_range(db_handler):
+    base = insert_summaries(db_handler, 5)
+
+    # 01:00 UTC expresso como 04:00+03:00; limite final exclusivo
+    start = (base + timedelta(hours=1)).astimezone(timezone(timedelta(hours=3)))
+    end = base + timedelta(hours=3)
+    found = db_handler.find_summaries(start=start, end=end)
+
+    assert [s['master_summary'] for s in found] == ['summary 2', 'summary 1']
+
+
+def test_find_latest_summary_by_source(db_handler):
+    insert_summaries(db_handler, 2, sources=('https://a.example/rss',))
+    insert_summaries(db_handler, 1, sources=('https://b.example/rss',))
+
+    latest = db_handler.find_latest_summary(source='https://a.example/rss')
+
+    assert latest['master_summary'] == 'summary 1'
+    assert db_handler.find_latest_summary(source='https://c.example/rss') is None
+
+
+def test_last_write_marker_changes_on_insert(db_handler):
+    before = db_handler.last_write_marker()
+    insert_summaries(db_handler, 1)
+    assert db_handler.last_write_marker() != before